@@ -1,13 +1,14 @@
 import jax.numpy as jnp
 from dctkit.dec import cochain as C
-from jax import Array, vmap
+from jax import Array, vmap, lax
 from functools import partial
 from typing import Callable, Dict, Optional
 
 
 def flat(c: C.CochainP0 | C.CochainD0, weights: Array, edges: C.CochainP1V |
          C.CochainD1V, interp_func: Optional[Callable] = None,
-         interp_func_args: Optional[Dict] = {}) -> C.CochainP1 | C.CochainD1:
+         interp_func_args: Optional[Dict] = {},
+         tile_size: Optional[int] = None) -> C.CochainP1 | C.CochainD1:
     """Applies the flat to a vector/tensor-valued cochain representing a discrete
     vector/tensor field to obtain a scalar-valued cochain over primal/dual edges.
 
@@ -25,21 +26,33 @@ def flat(c: C.CochainP0 | C.CochainD0, weights: Array, edges: C.CochainP1V |
             and providing in output a 1-cochain of the same type (primal/dual). If
             it is None, then an interpolation function is built as W^T@c.coeffs.
         interp_func_args: additional keyword arguments for interp_func
+        tile_size: if not None, the contraction with the edge vectors is streamed
+            over tiles of this many edges (jax.lax.map) instead of being fully
+            batched, bounding peak memory on large meshes.
     Returns:
         a primal/dual scalar/vector-valued cochain defined over primal/dual edges.
     """
     if interp_func is None:
-        # contract over the simplices of the input cochain (last axis of weights,
-        # first axis of input cochain coeffs)
-        def interp_func(x): return jnp.tensordot(weights.T, x.coeffs, axes=1)
-        interp_func_args = {}
-    weighted_v = interp_func(c, **interp_func_args)
-    # contract input vector/tensors with edge vectors (last indices of both
-    # coefficient matrices), for each target primal/dual edge
-    contract = partial(jnp.tensordot, axes=([-1,], [-1,]))
-    # map over target primal/dual edges
-    batch_contract = vmap(contract)
-    coch_coeffs = batch_contract(weighted_v, edges.coeffs)
+        # contract over the simplices of the input cochain (first axis of weights
+        # and of the input cochain coeffs) and with the edge vectors (last indices
+        # of both coefficient matrices) in a single einsum, so that XLA can choose
+        # a contraction path that avoids materializing the interpolated field
+        coch_coeffs = jnp.einsum("se,s...d,ed->e...", weights, c.coeffs,
+                                 edges.coeffs)
+    else:
+        weighted_v = interp_func(c, **interp_func_args)
+        # contract input vector/tensors with edge vectors (last indices of both
+        # coefficient matrices), for each target primal/dual edge
+        contract = partial(jnp.tensordot, axes=([-1,], [-1,]))
+        if tile_size is None:
+            # map over target primal/dual edges
+            batch_contract = vmap(contract)
+            coch_coeffs = batch_contract(weighted_v, edges.coeffs)
+        else:
+            # stream the edges in tiles to bound the working set
+            coch_coeffs = lax.map(lambda xy: contract(*xy),
+                                  (weighted_v, edges.coeffs),
+                                  batch_size=tile_size)
 
     if edges.is_primal:
         return C.CochainP1(c.complex, coch_coeffs)
@@ -9,6 +9,12 @@ from petsc4py import PETSc, init
 from petsc4py.PETSc import Vec
 import jaxopt
 
+# caches of the jitted objective/constraint graphs, keyed by the function
+# objects: problems built repeatedly on the same callables (e.g. tests that only
+# change the data arguments) reuse the traced graphs instead of recompiling
+_jitted_objectives: Dict = {}
+_jitted_constraints: Dict = {}
+
 
 class OptimizationProblem():
     """Class for (constrained) optimization problems.
@@ -45,18 +51,20 @@ class OptimizationProblem():
         self.last_opt_result = -1
 
     def __register_obj_and_grad_fn(self, objfun, constrfun, constr_args):
-        self.obj = jit(objfun)
-        # gradient of the objective function wrt parameters array
-        self.grad_obj = jit(grad(objfun))
-
-        self.objandgrad = jit(value_and_grad(objfun))
+        if objfun not in _jitted_objectives:
+            # gradient of the objective function wrt parameters array
+            _jitted_objectives[objfun] = (jit(objfun), jit(grad(objfun)),
+                                          jit(value_and_grad(objfun)))
+        self.obj, self.grad_obj, self.objandgrad = _jitted_objectives[objfun]
 
         self.constr_problem = False
         # constrained optimization problem
         if constrfun is not None:
-            self.constr = jit(constrfun)
-            # jacobian of the constraint equations wrt the parameters array
-            self.constr_grad = jit(jacrev(constrfun))
+            if constrfun not in _jitted_constraints:
+                # jacobian of the constraint equations wrt the parameters array
+                _jitted_constraints[constrfun] = (jit(constrfun),
+                                                  jit(jacrev(constrfun)))
+            self.constr, self.constr_grad = _jitted_constraints[constrfun]
             # TODO: check according to dt.float_dtype instead of np.float32 or 64
             check_type(constr_args, Dict[str, float | np.float32 | np.float64 |
                                          npt.NDArray | Array])
@@ -185,12 +193,15 @@ class JAXoptSolver(OptimizationSolver):
     def set_obj_args(self, args: Dict):
         self.prb.obj_args = args
 
-    def objective(self, x: npt.NDArray | Array) -> npt.NDArray | Array:
-        return self.prb.obj(x, **self.prb.obj_args)
+    def objective_and_gradient(self, x: npt.NDArray | Array) -> npt.NDArray | Array:
+        return self.prb.objandgrad(x, **self.prb.obj_args)
 
     def run(self, x0: npt.NDArray, **kwargs: Dict) -> npt.NDArray | Array:
         maxiter = kwargs["maxeval"]
-        solver = jaxopt.LBFGS(self.objective, maxiter=maxiter)
+        # hand the fused value_and_grad to LBFGS so the objective graph runs once
+        # per evaluation instead of once for the value and once for the gradient
+        solver = jaxopt.LBFGS(self.objective_and_gradient, value_and_grad=True,
+                              maxiter=maxiter)
         u = solver.run(x0).params.__array__()
         return u
 
@@ -1,6 +1,7 @@
 from functools import partial
 from jax import jit
-import jax.ops as ops
+from jax.experimental import sparse
+import jax.numpy as jnp
 from typing import Tuple
 from jax import Array
 import numpy.typing as npt
@@ -24,17 +25,43 @@ def spmm(A: Tuple[Array | npt.NDArray, Array | npt.NDArray, Array | npt.NDArray]
     assert v.ndim > 1
     rows, cols, vals = A
 
+    # represent A (or its transpose) as a BCOO matrix, so that the product lowers
+    # to a single fused sparse-dense matmul kernel instead of separate
+    # gather/scale/scatter ops
     if transpose:
-        vv = v.take(rows, axis=0)
+        indices = jnp.stack([cols, rows], axis=1)
     else:
-        vv = v.take(cols, axis=0)
+        indices = jnp.stack([rows, cols], axis=1)
+    # every COO operator in the library (boundary matrices, diagonal matrices)
+    # has distinct (row, col) pairs, so the kernel can skip duplicate resolution
+    mat = sparse.BCOO((vals, indices), shape=(shape, v.shape[0]),
+                      unique_indices=True)
 
-    # NOTE: make vals a column vector
-    prod = vals[:, None] * vv
-
-    if transpose:
-        result = ops.segment_sum(prod, cols, shape)
-    else:
-        result = ops.segment_sum(prod, rows, shape)
+    # contract the columns of A with the leading axis of v, keeping any extra
+    # trailing axes of v (vector/tensor-valued coefficients)
+    result = sparse.bcoo_dot_general(mat, v,
+                                     dimension_numbers=(((1,), (0,)), ((), ())))
 
     return result
+
+
+@partial(jit, static_argnums=(2, 3))
+def spmm_multi(A: Tuple[Array | npt.NDArray, Array | npt.NDArray, Array |
+                        npt.NDArray], vs: Tuple[Array | npt.NDArray, ...],
+               transposes: Tuple[bool, ...], shape=None) -> Tuple[Array, ...]:
+    """Performs several products of the same sparse COO matrix (or its transpose)
+    with dense matrices in a single compiled graph, so that the indices and values
+    of the matrix are loaded once and shared across the products.
+
+    Args:
+        A: tuple (rows,cols,values) representing the sparse matrix in COO format.
+        vs: tuple of matrices or column vectors.
+        transposes: tuple of flags, one per operand, telling whether to transpose
+            A before the corresponding multiplication.
+        shape: the number of rows of the matrix A.
+
+    Returns:
+        the tuple of the results of the matrix-matrix products.
+    """
+    return tuple(spmm(A, v, transpose=t, shape=shape)
+                 for v, t in zip(vs, transposes))
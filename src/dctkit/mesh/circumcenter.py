@@ -25,33 +25,28 @@ def circumcenter(S: npt.NDArray,
     float_dtype = dctkit.float_dtype
 
     # store the coordinates of the nodes for each simplex in S
-    S_coord = node_coords[S]
+    S_coord = node_coords[S].astype(float_dtype)
 
-    transpose_S_coord = np.transpose(S_coord, [0, 2, 1])
     # extract number of p-simplices and number of nodes per simplex
     num_p, num_nodes_per_spx = S.shape
 
-    # construct for each simplex s the matrix
-    # A_s = [B_s | 1_{m-1,1};
-    #        1_{1, m-1} |  0]
-    # where m-1 is the number of nodes per simplex and B is the matrix (m-1)x(m-1)
-    # defined as B_ij = 2 <v_i, v_j>
-    A = np.zeros((num_p, num_nodes_per_spx+1, num_nodes_per_spx+1), dtype=float_dtype)
-    A[:, :num_nodes_per_spx, :num_nodes_per_spx] = 2 * S_coord @ transpose_S_coord
-    A[:, :, -1] = 1
-    A[:, -1, :] = 1
-    A[:, -1, -1] = 0
-
-    # the vector of constant terms b for a given p-simplex s = {v_0,...,v_p} is
-    # [<v_0,v_0>, ..., <v_p,v_p>, 1], where v_i is the coordinate of the
-    # i-th node in s
-    b = np.ones((num_p, num_nodes_per_spx+1), dtype=float_dtype)
-    b[:, range(num_nodes_per_spx)] = np.sum(S_coord * S_coord, axis=2)
-
-    # barycentric coordinates x of the circumcenter are the solution
-    # of the linear sistem Ax = b without the last component (i.e. x[:-1])
-    bary_coords_extended = np.linalg.solve(A, b)
-    bary_coords = bary_coords_extended[:, :-1]
+    # compute the stack of edge-vector matrices V, where the i-th row of V_s is
+    # v_i - v_0 (same idiom used in volume.unsigned_volume)
+    V = S_coord[:, 1:, :] - S_coord[:, :1, :]
+
+    # writing the circumcenter as c = v_0 + sum_j x_j (v_j - v_0), the equidistance
+    # conditions |c - v_j| = |c - v_0| reduce to the Gram system G x = b, where
+    # G_ij = <v_i - v_0, v_j - v_0> and b_j = |v_j - v_0|^2/2
+    G = V @ np.transpose(V, [0, 2, 1])
+    b = 0.5*np.sum(V*V, axis=2)
+
+    # solve all the Gram systems at once (batched LAPACK call); the barycentric
+    # coordinates of the circumcenter wrt v_1,...,v_p are the solutions x, while
+    # the one wrt v_0 follows from the partition of unity
+    x = np.linalg.solve(G, b[..., None])[..., 0]
+    bary_coords = np.empty((num_p, num_nodes_per_spx), dtype=float_dtype)
+    bary_coords[:, 1:] = x
+    bary_coords[:, 0] = 1 - np.sum(x, axis=1)
 
     # the circumcenter of a p-simplex {v0,...,vp} can be written in barycentric
     # coordinates as c = sum_j x_j v_j
@@ -69,7 +69,10 @@ class SimplicialComplex:
         self.boundary = sl.ShiftedList([None] * self.dim, -1)
         self.simplices_faces = sl.ShiftedList([None] * self.dim, -1)
         for p in range(self.dim):
-            boundary, vals, faces_ordered = compute_boundary_COO(self.S[self.dim - p])
+            # the (p-1)-faces produced by each pass have their node IDs already
+            # sorted, so only the top-level simplices need the copy-and-sort step
+            boundary, vals, faces_ordered = compute_boundary_COO(
+                self.S[self.dim - p], is_rows_sorted=p > 0)
             self.boundary[self.dim - p] = boundary
             self.S[self.dim - p - 1] = vals
             # NOTE: the cofaces of a simplex can be determined by the coboundary matrix
@@ -138,31 +141,38 @@ class SimplicialComplex:
             else:
                 circ_pm1 = self.circ[p - 1]
                 num_pm1, _ = self.S[p - 1].shape
-            dv = np.zeros(num_pm1, dtype=self.float_dtype)
-            # Loop over p-simplices
-            for i in range(num_p):
-                face_id = self.simplices_faces[p][i, :]
-                # Distances between circumcenter of the p-simplex and the boundary
-                # (p-1)-simplices
-                length = np.linalg.norm(self.circ[p][i, :] - circ_pm1[face_id, :],
-                                        axis=1)
-
-                # Find opposite vertexes to the (p-1)-simplices
-                if p == 1:
-                    opp_vert = np.array(
-                        [list(set(self.S[p][i]) - set(j.flatten())) for j in face_id])
-                else:
-                    opp_vert = np.array([list(set(self.S[p][i]) -
-                                              set(self.S[p - 1][j])) for j in face_id])
-                opp_vert_index = [list(self.S[p][i]).index(j) for j in opp_vert]
-
-                # Sign of the dual volume of the boundary (p-1)-simplex = sign of
-                # the barycentric coordinate of the circumcenter of the parent
-                # p-simplex relative to the opposite vertex
-                sign = np.copysign(1, self.bary_circ[p][i, opp_vert_index])
-                # Update dual volume of the boundary (p-1)-simplex
-                dv[face_id] += sign * (length*self.dual_volumes[p][i] /
-                                       (self.dim - p + 1))
+            faces_ids = self.simplices_faces[p]
+            # Distances between the circumcenters of the p-simplices and those of
+            # their boundary (p-1)-simplices, for all (simplex, face) pairs at once
+            length = np.linalg.norm(self.circ[p][:, None, :] -
+                                    circ_pm1[faces_ids], axis=2)
+
+            # Find opposite vertexes to the (p-1)-simplices: the opposite vertex
+            # of a face is the node of the parent p-simplex not belonging to it
+            if p == 1:
+                # faces = nodes, so the face node IDs are the IDs themselves
+                faces_nodes = faces_ids[:, :, None]
+            else:
+                faces_nodes = self.S[p - 1][faces_ids]
+            parent_nodes = self.S[p]
+            is_in_face = (parent_nodes[:, None, :, None] ==
+                          faces_nodes[:, :, None, :]).any(axis=-1)
+            opp_vert_index = (~is_in_face).argmax(axis=-1)
+
+            # Sign of the dual volume of the boundary (p-1)-simplex = sign of
+            # the barycentric coordinate of the circumcenter of the parent
+            # p-simplex relative to the opposite vertex (when the coordinate is
+            # zero the corresponding length vanishes, so the sign is immaterial)
+            opp_vert_bary = np.take_along_axis(self.bary_circ[p],
+                                               opp_vert_index, axis=1)
+            sign = np.where(opp_vert_bary >= 0, 1., -1.)
+            # Accumulate dual volumes of the boundary (p-1)-simplices; np.bincount
+            # performs the signed scatter-sum in a single buffered pass (much faster
+            # than np.add.at)
+            contributions = sign * (length*self.dual_volumes[p][:, None] /
+                                    (self.dim - p + 1))
+            dv = np.bincount(faces_ids.ravel(), weights=contributions.ravel(),
+                             minlength=num_pm1).astype(self.float_dtype)
 
             self.dual_volumes[p - 1] = dv
 
@@ -481,11 +491,42 @@ def __simplex_array_parity(s: npt.NDArray) -> npt.NDArray:
     return trans
 
 
-def compute_boundary_COO(S: npt.NDArray) -> Tuple[list, npt.NDArray, npt.NDArray]:
+def __lexsort_rows(keys: npt.NDArray) -> npt.NDArray:
+    """Compute the permutation that sorts the rows of a matrix of non-negative
+    integers lexicographically.
+
+    When the entries are small enough, the columns are packed into a single int64
+    key via bit-shifting, so that a single argsort replaces the column-by-column
+    passes of np.lexsort.
+
+    Args:
+        keys: matrix of non-negative integers whose rows are to be sorted.
+
+    Returns:
+        array of row indices that sorts the rows lexicographically.
+    """
+    num_cols = keys.shape[1]
+    # number of bits needed to store the largest entry
+    bits = int(keys.max()).bit_length() if keys.size > 0 else 1
+    if num_cols*bits < 63:
+        packed = keys[:, 0].astype(np.int64)
+        for i in range(1, num_cols):
+            packed = (packed << bits) | keys[:, i].astype(np.int64)
+        # stable sort to preserve the original relative order of duplicate rows,
+        # as np.lexsort does
+        return packed.argsort(kind="stable")
+    return np.lexsort(keys.T[::-1])
+
+
+def compute_boundary_COO(S: npt.NDArray,
+                         is_rows_sorted: bool = False) -> Tuple[list, npt.NDArray,
+                                                                npt.NDArray]:
     """Compute the COO representation of the boundary matrix of all p-simplices.
 
     Args:
         S: matrix of the IDs of the nodes (cols) belonging to each p-simplex (rows).
+        is_rows_sorted: True if the rows of S are already sorted in ascending order,
+            in which case the copy-and-sort step is skipped.
 
     Returns:
         a tuple containing a list with the COO representation of the boundary, the
@@ -502,16 +543,27 @@ def compute_boundary_COO(S: npt.NDArray) -> Tuple[list, npt.NDArray, npt.NDArray
     N = num_simplices * nodes_per_simplex
 
     # compute array of relative orientations of the (p-1)-faces wrt the
-    # p-simplices
-    orientations = 1 - 2 * __simplex_array_parity(S)
+    # p-simplices; sorted rows have even parity, so no copy or counting pass
+    # is needed in that case
+    if is_rows_sorted:
+        orientations = np.ones(num_simplices, dtype=S.dtype)
+        F = S
+    else:
+        orientations = 1 - 2 * __simplex_array_parity(S)
 
-    # sort the rows of S lexicographically
-    # FIXME: avoid making a copy and sorting every time
-    F = S.copy()
-    F.sort(axis=1)
+        # sort the rows of S lexicographically
+        F = S.copy()
+        F.sort(axis=1)
+
+    # node and simplex IDs fit comfortably in 32 bits for any practical mesh;
+    # use the narrower dtype to halve the bandwidth of the sort passes
+    if max(int(S.max(initial=0)), num_simplices) < np.iinfo(np.int32).max:
+        ext_dtype = np.int32
+    else:
+        ext_dtype = dctkit.int_dtype
 
     # S_(p-1) matrix with repeated (p-1)-simplices and with two extra columns
-    S_pm1_ext = np.empty((N, nodes_per_simplex + 1), dtype=dctkit.int_dtype)
+    S_pm1_ext = np.empty((N, nodes_per_simplex + 1), dtype=ext_dtype)
 
     # find the node IDs of the (p-1)-simplices and store their relative
     # orientations wrt the parent simplex
@@ -529,8 +581,7 @@ def compute_boundary_COO(S: npt.NDArray) -> Tuple[list, npt.NDArray, npt.NDArray
         rows[:, -2] = ((-1)**i) * orientations
 
     # order faces lexicographically (copied from PyDEC)
-    # FIXME: maybe use sort
-    faces_ordered = S_pm1_ext[np.lexsort(S_pm1_ext[:, :-2].T[::-1])]
+    faces_ordered = S_pm1_ext[__lexsort_rows(S_pm1_ext[:, :-2])]
     values = faces_ordered[:, -2]
     column_index = faces_ordered[:, -1]
     faces = faces_ordered[:, :-2]
@@ -538,9 +589,15 @@ def compute_boundary_COO(S: npt.NDArray) -> Tuple[list, npt.NDArray, npt.NDArray
     # compute the matrix obtained from faces removing the duplicate rows and mantaining
     # the lexicographically order (unique faces) and the vector of occurences for each
     # non-duplicate row (rows_index); e.g. if faces = [[1,2];[1,3];[1,3];[1,4]],
-    # then unique_faces = [[1,2]; [1,3]; [1,4]] and rows_index = [0; 1; 1; 2]
-    unique_faces, rows_index = np.unique(faces, axis=0, return_inverse=True)
-    rows_index = rows_index.astype(dtype=dctkit.int_dtype)
+    # then unique_faces = [[1,2]; [1,3]; [1,4]] and rows_index = [0; 1; 1; 2].
+    # Since the faces are already sorted lexicographically, duplicates are adjacent
+    # and both quantities follow from a single row-change scan, with no need for
+    # the re-sort done by np.unique(axis=0)
+    is_new_face = np.empty(N, dtype=bool)
+    is_new_face[0] = True
+    np.any(faces[1:] != faces[:-1], axis=1, out=is_new_face[1:])
+    unique_faces = faces[is_new_face]
+    rows_index = (np.cumsum(is_new_face) - 1).astype(dtype=dctkit.int_dtype)
     boundary_COO = [rows_index, column_index, values]
 
     return boundary_COO, unique_faces, faces_ordered
@@ -565,13 +622,18 @@ def compute_simplices_faces(S: npt.NDArray, faces_ordered:
 
     # for triangles and tets, compute the matrix explicitly
     if p > 1:
-        # order faces_ordered w.r.t last column
-        faces_ordered_last = faces_ordered[faces_ordered[:, -1].argsort()]
-
-        # unique returns an array that must be reshaped into a matrix
-        _, simplices_faces = np.unique(
-            faces_ordered_last[:, :-2], axis=0, return_inverse=True)
-        simplices_faces = simplices_faces.reshape(
+        # the rows of faces_ordered are already sorted lexicographically, hence
+        # duplicate faces are adjacent and the ID of the unique face corresponding
+        # to each row is the running count of row changes
+        faces = faces_ordered[:, :-2]
+        is_new_face = np.empty(faces.shape[0], dtype=bool)
+        is_new_face[0] = True
+        np.any(faces[1:] != faces[:-1], axis=1, out=is_new_face[1:])
+        faces_ids = np.cumsum(is_new_face) - 1
+
+        # gather the face IDs by parent p-simplex (last column of faces_ordered)
+        parent_order = faces_ordered[:, -1].argsort()
+        simplices_faces = faces_ids[parent_order].reshape(
             faces_ordered.shape[0] // nodes_per_simplex, nodes_per_simplex)
 
     # for edges, take S[1]
@@ -1,5 +1,4 @@
 import numpy as np
-import dctkit
 import numpy.typing as npt
 from scipy.special import factorial
 
@@ -15,25 +14,35 @@ def unsigned_volume(S: npt.NDArray, node_coords: npt.NDArray) -> float:
     Returns:
         unsigned volume of the simplex.
     """
-    int_dtype = dctkit.int_dtype
-
     # store the coordinates of the nodes of every simplex in S
     S_coord = node_coords[S]
     rows = S_coord.shape[1]
-
-    # indices to extract the matrix with rows equal to the rows of S with indices
-    # non-congruent to 0 modulo rows-1
-    index = 1 + np.array(range(rows-1), dtype=int_dtype)
+    p = rows - 1
+    space_dim = S_coord.shape[2]
 
     # compute the matrix of matrices V
-    V = S_coord[:, index, :] - S_coord[:, ::(rows), :]
-
-    # compute the transpose of V with respect to the last two axes
-    transpose_V = np.transpose(V, [0, 2, 1])
-
-    VTV = np.matmul(V, transpose_V)
-    # math formula to compute the unsigned volume of a simplex
-    vol = np.sqrt(np.abs(np.linalg.det(VTV)))/factorial(rows - 1)
+    V = S_coord[:, 1:, :] - S_coord[:, :1, :]
+
+    # closed-form expressions for edges, triangles and tets, avoiding the batched
+    # determinant of the Gram matrices
+    if p == 1:
+        vol = np.linalg.norm(V[:, 0, :], axis=-1)
+    elif p == 2:
+        cross = np.cross(V[:, 0, :], V[:, 1, :])
+        if space_dim == 2:
+            vol = 0.5*np.abs(cross)
+        else:
+            vol = 0.5*np.linalg.norm(cross, axis=-1)
+    elif p == 3 and space_dim == 3:
+        vol = np.abs(np.einsum("ni,ni->n", V[:, 0, :],
+                               np.cross(V[:, 1, :], V[:, 2, :])))/6
+    else:
+        # compute the transpose of V with respect to the last two axes
+        transpose_V = np.transpose(V, [0, 2, 1])
+
+        VTV = np.matmul(V, transpose_V)
+        # math formula to compute the unsigned volume of a simplex
+        vol = np.sqrt(np.abs(np.linalg.det(VTV)))/factorial(rows - 1)
     return vol
 
 
@@ -47,20 +56,24 @@ def signed_volume(S: npt.NDArray, node_coords: npt.NDArray) -> float:
     Returns:
         signed volume of the simplex.
     """
-    int_dtype = dctkit.int_dtype
-
     S_coord = node_coords[S]
     _, rows, cols = S_coord.shape
 
     assert (rows == cols + 1)
 
-    # indices to extract the matrix with rows equal to the rows of S with indices
-    # non-congruent to 0 modulo rows-1
-    index = 1 + np.array(range(rows-1), dtype=int_dtype)
-
     # compute the matrix of matrices V
-    V = S_coord[:, index, :] - S_coord[:, ::(rows), :]
-
-    # formula to compute the signed volume of a simplex (see Bell et al.)
-    vol = np.linalg.det(V) / factorial(rows-1)
+    V = S_coord[:, 1:, :] - S_coord[:, :1, :]
+
+    # closed-form determinants for the common dimensions, avoiding the batched
+    # LAPACK call
+    if cols == 1:
+        vol = V[:, 0, 0]
+    elif cols == 2:
+        vol = 0.5*(V[:, 0, 0]*V[:, 1, 1] - V[:, 0, 1]*V[:, 1, 0])
+    elif cols == 3:
+        vol = np.einsum("ni,ni->n", V[:, 0, :],
+                        np.cross(V[:, 1, :], V[:, 2, :]))/6
+    else:
+        # formula to compute the signed volume of a simplex (see Bell et al.)
+        vol = np.linalg.det(V) / factorial(rows-1)
     return vol
@@ -51,8 +51,9 @@ class Elastica():
             value of the energy.
 
         """
-        # apply bc at left end
-        theta = jnp.insert(theta, 0, theta_0)
+        # apply bc at left end (concatenate lowers to a single XLA op, unlike
+        # jnp.insert)
+        theta = jnp.concatenate([jnp.full(1, theta_0, dtype=dt.float_dtype), theta])
         theta_coch = C.CochainD0(complex=self.S, coeffs=theta)
 
         # define dimensionless load
@@ -86,5 +87,5 @@ class Elastica():
             error between the candidate and the true solutions.
 
         """
-        theta = jnp.insert(theta, 0, theta_true[0])
+        theta = jnp.concatenate([theta_true[:1], theta])
         return jnp.sum(jnp.square(theta-theta_true))
@@ -65,7 +65,8 @@ def obj_poisson(x: npt.NDArray, f: npt.NDArray, S: simplex.SimplicialComplex, k:
 
     # use mask to zero residual on dual cells at the boundary where nodal values are
     # imposed
-    energy = 0.5*np.linalg.norm(r*mask)**2 + 0.5*gamma*penalty
+    rm = r*mask
+    energy = 0.5*np.sum(rm*rm) + 0.5*gamma*penalty
     return energy
 
 
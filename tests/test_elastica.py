@@ -3,33 +3,30 @@ import dctkit as dt
 import jax.numpy as jnp
 from jax import jit, grad, Array
 from dctkit.math.opt import optctrl
-from scipy import sparse
 import os
+import pytest
 from dctkit.physics import elastica as el
 import numpy.typing as npt
 from dctkit.dec import cochain as C
 from typing import Tuple
 
+num_elements = 10
+L = 1
 
-def compute_transform_theta_xy(num_nodes: int) -> npt.NDArray:
-    # bidiagonal matrix to transform theta in (x,y)
-    diag = [1]*(num_nodes)
-    upper_diag = [-1]*(num_nodes-1)
-    upper_diag[0] = 0
-    diags = [diag, upper_diag]
-    transform = sparse.diags(diags, [0, -1]).toarray()
-    transform[1, 0] = -1
-    return transform
-
-
-def reconstruct_xy(theta: Array, h: float, num_nodes: int) -> Tuple[Array, Array]:
-    transform = compute_transform_theta_xy(num_nodes)
-    cos_theta = h*jnp.cos(theta)
-    sin_theta = h*jnp.sin(theta)
-    b_x = jnp.insert(cos_theta, 0, 0)
-    b_y = jnp.insert(sin_theta, 0, 0)
-    x = jnp.linalg.solve(transform, b_x)
-    y = jnp.linalg.solve(transform, b_y)
+
+@pytest.fixture(scope="module")
+def ela():
+    # share the mesh and complex construction across the tests of this module;
+    # each test still builds its own optimization problem
+    return el.Elastica(num_elements=num_elements, L=L)
+
+
+def reconstruct_xy(theta: Array, h: float) -> Tuple[Array, Array]:
+    # the transformation from theta to (x,y) is a unit lower-bidiagonal system
+    # (x_i - x_{i-1} = h*cos(theta_i), x_0 = 0), whose solution is a cumulative sum
+    zero = jnp.zeros(1, dtype=dt.float_dtype)
+    x = jnp.cumsum(jnp.concatenate([zero, h*jnp.cos(theta)]))
+    y = jnp.cumsum(jnp.concatenate([zero, h*jnp.sin(theta)]))
     return x, y
 
 
@@ -38,15 +35,13 @@ def compute_true_solution(data: npt.NDArray, sampling: int,
                                                       npt.NDArray]:
     x_true = data[:, 1][::sampling]
     y_true = data[:, 2][::sampling]
-    theta_true = np.empty(num_elements, dtype=dt.float_dtype)
-    for i in range(num_elements):
-        theta_true[i] = np.arctan(
-            (y_true[i+1]-y_true[i])/(x_true[i+1]-x_true[i]))
+    theta_true = np.arctan(np.diff(y_true[:num_elements+1]) /
+                           np.diff(x_true[:num_elements+1])).astype(dt.float_dtype)
 
     return theta_true, x_true, y_true
 
 
-def test_elastica_energy(setup_test):
+def test_elastica_energy(setup_test, ela):
     data = "data/xy_F_20.txt"
     F = -20.
     np.random.seed(42)
@@ -58,16 +53,12 @@ def test_elastica_energy(setup_test):
     # sampling factor for true data
     sampling = 10
 
-    num_elements = 10
-
-    L = 1
     h = L/(num_elements)
 
-    ela = el.Elastica(num_elements=num_elements, L=L)
     num_nodes = ela.S.num_nodes
 
     # initial guess for the angles (EXCEPT THE FIRST ANGLE, FIXED BY BC)
-    theta_in = 0.1*np.random.rand(num_elements-1).astype(dt.float_dtype)
+    theta_in = 0.1*np.random.rand(num_elements-1).astype(dt.float_dtype, copy=False)
 
     B_in = 1.
 
@@ -107,13 +98,13 @@ def test_elastica_energy(setup_test):
     theta = x[:-1]
     theta = np.insert(theta, 0, theta_true[0])
 
-    x, y = reconstruct_xy(theta, h, num_nodes)
+    x, y = reconstruct_xy(theta, h)
 
     error = np.linalg.norm(x - x_true) + np.linalg.norm(y - y_true)
     assert error <= 2e-2
 
 
-def test_elastica_residual(setup_test):
+def test_elastica_residual(setup_test, ela):
     data = "data/xy_F_35.txt"
     F = -35.
     np.random.seed(42)
@@ -125,16 +116,12 @@ def test_elastica_residual(setup_test):
     # sampling factor for true data
     sampling = 10
 
-    num_elements = 10
-
-    L = 1
     h = L/(num_elements)
 
     B = 7.854
 
     A = F*L**2/B
 
-    ela = el.Elastica(num_elements=num_elements, L=L)
     num_nodes = ela.S.num_nodes
 
     # compute true solution
@@ -155,7 +142,7 @@ def test_elastica_residual(setup_test):
 
     def obj(x: npt.NDArray) -> Array:
         # apply Dirichlet BC at left end
-        theta = jnp.insert(x, 0, theta_true[0])
+        theta = jnp.concatenate([theta_true[:1], x])
         theta_coch = C.CochainD0(ela.S, theta)
 
         # dimensionless curvature at primal nodes (primal 0-cochain)
@@ -171,20 +158,23 @@ def test_elastica_residual(setup_test):
 
         return jnp.linalg.norm(residual.coeffs[1:])
 
+    # jaxopt LBFGS keeps the whole iteration inside a compiled XLA graph, with
+    # no host-side callback per evaluation
     prb = optctrl.OptimizationProblem(
-        dim=num_elements-1, state_dim=num_elements-1, objfun=obj)
+        dim=num_elements-1, state_dim=num_elements-1, objfun=obj,
+        solver_lib="jaxopt")
 
     prb.set_obj_args({})
     sol = prb.solve(x0=theta_0)
     theta = jnp.insert(sol, 0, theta_true[0])
 
-    x, y = reconstruct_xy(theta, h, num_nodes)
+    x, y = reconstruct_xy(theta, h)
 
     error = np.linalg.norm(x - x_true) + np.linalg.norm(y - y_true)
     assert error <= 2e-2
 
 
-def test_elastica_residual_tuneB(setup_test):
+def test_elastica_residual_tuneB(setup_test, ela):
     data = "data/xy_F_35.txt"
     F = -35.
     np.random.seed(42)
@@ -196,12 +186,8 @@ def test_elastica_residual_tuneB(setup_test):
     # sampling factor for true data
     sampling = 10
 
-    num_elements = 10
-
-    L = 1
     h = L/(num_elements)
 
-    ela = el.Elastica(num_elements=num_elements, L=L)
     num_nodes = ela.S.num_nodes
 
     # initial guess for the angles (EXCEPT THE FIRST ANGLE, FIXED BY BC)
@@ -224,7 +210,7 @@ def test_elastica_residual_tuneB(setup_test):
 
     def energy(theta: npt.NDArray, B, theta_0, F) -> Array:
         # apply Dirichlet BC at left end
-        theta = jnp.insert(theta, 0, theta_0)
+        theta = jnp.concatenate([jnp.full(1, theta_0, dtype=dt.float_dtype), theta])
         theta_coch = C.CochainD0(ela.S, theta)
 
         # dimensionless curvature at primal nodes (primal 0-cochain)
@@ -233,9 +219,9 @@ def test_elastica_residual_tuneB(setup_test):
 
         A = F*L**2/B
 
-        A_coch = C.CochainD0(ela.S, A*jnp.ones(num_elements, dtype=dt.float_dtype))
-
-        load = C.cochain_mul(C.cos(theta_coch), A_coch)
+        # reuse the constant unit cochain of the complex instead of rebuilding it
+        # at every evaluation
+        load = C.cochain_mul(C.cos(theta_coch), C.scalar_mul(ela.ones_coch, A))
 
         # dimensionless bending moment
         moment = curv
@@ -279,7 +265,7 @@ def test_elastica_residual_tuneB(setup_test):
     theta = x[:-1]
     theta = np.insert(theta, 0, theta_true[0])
 
-    x, y = reconstruct_xy(theta, h, num_nodes)
+    x, y = reconstruct_xy(theta, h)
 
     error = np.linalg.norm(x - x_true) + np.linalg.norm(y - y_true)
     assert error <= 2e-2
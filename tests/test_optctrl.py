@@ -87,7 +87,7 @@ def test_optimal_control_poisson(setup_test):
     f_true = -4.*np.ones(1, dtype=dt.float_dtype)
 
     # initial guess
-    u_0 = 0.01*np.random.rand(dim_0).astype(dt.float_dtype)
+    u_0 = 0.01*np.random.rand(dim_0).astype(dt.float_dtype, copy=False)
     u_0 = np.array(u_0, dtype=dt.float_dtype)
 
     gamma = 100000.
@@ -3,6 +3,9 @@ import jax.numpy as jnp
 import jax
 import dctkit as dt
 from scipy.optimize import minimize
+import scipy.sparse as sps
+from scipy.sparse.linalg import cg
+from jax.experimental import sparse as jsparse
 from dctkit.mesh import util
 from dctkit.physics import poisson as p
 from dctkit.dec import cochain as C
@@ -12,23 +15,30 @@ from functools import partial
 
 
 cases = [["jaxopt", False], ["jaxopt", True], ["pygmo", True],
-         ["pygmo", False], ["scipy", False], ["scipy", True]]
+         ["pygmo", False], ["scipy", False], ["scipy", True], ["cg", False]]
+
+
+@pytest.fixture(scope="module")
+def poisson_complex():
+    # share the mesh and the DEC precomputation across the parametrized cases;
+    # the complex is only read by the tests
+    lc = 0.5
+    mesh, _ = util.generate_square_mesh(lc)
+    S = util.build_complex_from_mesh(mesh)
+    S.get_hodge_star()
+    bnodes = mesh.cell_sets_dict["boundary"]["line"]
+    return S, bnodes
 
 
 @pytest.mark.parametrize('optimizer,energy_formulation', cases)
-def test_poisson(setup_test, optimizer, energy_formulation):
+def test_poisson(setup_test, poisson_complex, optimizer, energy_formulation):
     """Solve the problem k*Delta u + f = 0."""
     if jax.config.read("jax_enable_x64"):
         assert dt.float_dtype == "float64"
 
     np.random.seed(42)
 
-    lc = 0.5
-
-    mesh, _ = util.generate_square_mesh(lc)
-    S = util.build_complex_from_mesh(mesh)
-    S.get_hodge_star()
-    bnodes = mesh.cell_sets_dict["boundary"]["line"]
+    S, bnodes = poisson_complex
     node_coord = S.node_coords
 
     k = 1.
@@ -48,30 +58,78 @@ def test_poisson(setup_test, optimizer, energy_formulation):
     mask = np.ones((num_nodes, 1), dtype=dt.float_dtype)
     mask[bnodes, :] = 0.
 
+    # indices of the interior nodes, where the residual is not zeroed out
+    interior = np.setdiff1d(np.arange(num_nodes, dtype=dt.int_dtype),
+                            bnodes).astype(dt.int_dtype)
+
+    # the Laplace-de Rham operator on 0-cochains is the fixed linear map
+    # star_0^-1 @ B_1 @ star_1 @ B_1^T; assemble it once as a sparse matrix
+    # (with the -k factor of the scalar Laplacian folded in) so the residual
+    # objectives cost a single sparse matvec per iteration instead of a chain
+    # of DEC operator applications
+    rows, cols, vals = S.boundary[1]
+    B_1 = sps.coo_matrix((vals.astype(dt.float_dtype), (rows, cols)),
+                         shape=(num_nodes, S.S[1].shape[0]))
+    L = sps.diags(1./S.hodge_star[0]) @ B_1 @ \
+        sps.diags(S.hodge_star[1]) @ B_1.T
+    L_bcoo = jsparse.BCOO.from_scipy_sparse(-k*L.tocoo())
+
     # initial guess (notice that this is a row vector)
-    u_0 = 0.01*np.random.rand(num_nodes).astype(dt.float_dtype)
+    u_0 = 0.01*np.random.rand(num_nodes).astype(dt.float_dtype, copy=False)
     u_0 = np.array(u_0, dtype=dt.float_dtype)
 
-    if optimizer == "scipy":
+    if optimizer == "cg":
+        print("Using CG solver...")
+
+        # the Poisson problem is linear: symmetrize the Laplacian with the
+        # 0-form Hodge star and solve the Dirichlet-reduced SPD system with
+        # conjugate gradients (a handful of matvecs instead of hundreds of
+        # quasi-Newton iterations)
+        K = (k*(B_1 @ sps.diags(S.hodge_star[1]) @ B_1.T)).tocsr()
+        b = S.hodge_star[0]*f_vec.ravel()
+        K_ii = K[interior][:, interior]
+        rhs = b[interior] - K[interior][:, bnodes] @ b_values
+
+        u_interior, info = cg(K_ii, rhs, M=sps.diags(1./K_ii.diagonal()))
+        assert info == 0
+
+        u = np.zeros(num_nodes, dtype=dt.float_dtype)
+        u[bnodes] = b_values
+        u[interior] = u_interior.astype(dt.float_dtype)
+
+    elif optimizer == "scipy":
         print("Using SciPy optimizer...")
 
         if energy_formulation:
             print("Using energy formulation...")
-            obj = p.energy_poisson
-            gradfun = p.grad_energy_poisson
+            fun = p.energy_poisson
+            jac = p.grad_energy_poisson
             gamma = 1e3
             args = (f_vec, S, k, boundary_values, gamma)
         else:
             print("Solving Poisson equation...")
-            obj = p.obj_poisson
-            gradfun = p.grad_obj_poisson
             gamma = 10000.
-            args = (star_f.coeffs, S, k, boundary_values, gamma, mask)
-
-        u = minimize(fun=obj, x0=u_0, args=args, method='BFGS',
-                     jac=gradfun, options={'disp': 1})
-        # NOTE: minimize returns a float64 array
-        u = u.x.astype(dt.float_dtype)
+            obj_args = (star_f.coeffs, S, k, boundary_values, gamma, mask)
+            # a fused forward+backward pass replaces the hand-written gradient,
+            # which recomputes the residual a second time per evaluation
+            obj_and_grad = jax.jit(jax.value_and_grad(
+                lambda x: p.obj_poisson(x, *obj_args)))
+
+            def fun(x):
+                v, g = obj_and_grad(x)
+                return float(v), np.asarray(g)
+
+            jac = True
+            args = ()
+
+        # L-BFGS-B keeps a limited-memory Hessian approximation (O(maxcor*N)
+        # instead of the dense O(N^2) matrix stored by BFGS)
+        u = minimize(fun=fun, x0=u_0, args=args, method='L-BFGS-B',
+                     jac=jac, options={'disp': 1, 'maxcor': 20,
+                                       'ftol': 1e-10})
+        # NOTE: minimize returns a float64 array; the cast is free under the
+        # float64 configuration
+        u = u.x.astype(dt.float_dtype, copy=False)
 
     elif optimizer == "pygmo":
         print("Using pygmo optimizer...")
@@ -86,75 +144,77 @@ def test_poisson(setup_test, optimizer, energy_formulation):
         else:
             print("Solving Poisson equation...")
 
-            def obj_poisson(x, f, k, boundary_values, gamma, mask):
+            def obj_poisson(x, f, boundary_values, gamma):
                 pos, value = boundary_values
-                c = C.Cochain(0, True, S, x)
-                # compute Laplace-de Rham of c
-                laplacian = C.laplacian(c)
-                # the Laplacian on forms is the negative of the Laplacian on scalar
-                # fields
-                laplacian.coeffs *= -k
-                # compute the residual of the Poisson equation k*Delta u + f = 0
-                r = laplacian.coeffs + f
-                penalty = jnp.sum((x[pos] - value)**2)
-                obj = 0.5*jnp.linalg.norm(r*mask)**2 + 0.5*gamma*penalty
+                # compute the residual of the Poisson equation k*Delta u + f = 0;
+                # the Laplacian on forms is the negative of the Laplacian on
+                # scalar fields (the sign is folded into L_bcoo)
+                r = f + (L_bcoo @ x)[:, None]
+                # single fused gather+subtract+dot for the boundary penalty
+                d = x[pos] - value
+                penalty = jnp.vdot(d, d)
+                # squared L2 norm of the interior residual, without the sqrt:
+                # same minimum, cheaper forward pass and no 0/0 in the gradient
+                # at the optimum; gathering the interior entries touches fewer
+                # bytes than multiplying by the full boundary mask
+                obj = 0.5*jnp.sum(r[interior]**2) + 0.5*gamma*penalty
                 return obj
             obj = obj_poisson
-            args = {'f': f_vec, 'k': k, 'boundary_values': boundary_values,
-                    'gamma': gamma, 'mask': mask}
+            args = {'f': f_vec, 'boundary_values': boundary_values,
+                    'gamma': gamma}
 
         prb = oc.OptimizationProblem(dim=num_nodes, state_dim=num_nodes, objfun=obj)
-        prb.set_obj_args(args)
+        # move the bound arguments to the device once, instead of converting the
+        # host arrays at every objective evaluation
+        prb.set_obj_args(jax.device_put(args))
         u = prb.solve(u_0, algo="lbfgs").astype(dt.float_dtype)
 
     elif optimizer == "jaxopt":
         print("Using jaxopt optimizer...")
 
-        gamma = 1000.
+        # eliminate the Dirichlet DOFs: optimize only the interior values and
+        # substitute the boundary values in the closure, so no penalty term (and
+        # no penalty-induced ill-conditioning) is needed
+        u_bnd = jnp.zeros(num_nodes,
+                          dtype=dt.float_dtype).at[bnodes].set(b_values)
+
+        # close the objectives over device-resident constants, so XLA folds
+        # them into the compiled graph instead of re-packing host arrays at
+        # every evaluation
+        f_jnp = jnp.asarray(f_vec)
 
         if energy_formulation:
             print("Using energy formulation...")
 
-            def energy_poisson(x, f, k, boundary_values, gamma):
-                pos, value = boundary_values
-                f = C.Cochain(0, True, S, f)
-                u = C.Cochain(0, True, S, x)
+            f_coch = C.Cochain(0, True, S, f_jnp)
+
+            def energy_poisson(x):
+                u = C.Cochain(0, True, S, u_bnd.at[interior].set(x))
                 du = C.coboundary(u)
                 norm_grad = k/2.*C.inner(du, du)
-                bound_term = -C.inner(u, f)
-                penalty = 0.5*gamma*jnp.sum((x[pos] - value)**2)
-                energy = norm_grad + bound_term + penalty
+                bound_term = -C.inner(u, f_coch)
+                energy = norm_grad + bound_term
                 return energy
 
-            args = {'f': f_vec, 'k': k, 'boundary_values': boundary_values,
-                    'gamma': gamma}
             obj = energy_poisson
 
         else:
             print("Solving Poisson equation...")
 
-            def obj_poisson(x, f, k, boundary_values, gamma, mask):
-                pos, value = boundary_values
-                c = C.Cochain(0, True, S, x)
-                # compute Laplace-de Rham of c
-                laplacian = C.laplacian(c)
-                # the Laplacian on forms is the negative of the Laplacian on scalar
-                # fields
-                laplacian.coeffs *= -k
+            def obj_poisson(x):
+                u = u_bnd.at[interior].set(x)
                 # compute the residual of the Poisson equation k*Delta u + f = 0
-                r = laplacian.coeffs + f
-                penalty = jnp.sum((x[pos] - value)**2)
-                obj = 0.5*jnp.linalg.norm(r*mask)**2 + 0.5*gamma*penalty
+                r = (L_bcoo @ u)[:, None] + f_jnp
+                obj = 0.5*jnp.sum(r[interior]**2)
                 return obj
 
-            args = {'f': f_vec, 'k': k, 'boundary_values': boundary_values,
-                    'gamma': gamma, 'mask': mask}
             obj = obj_poisson
 
-        prb = oc.OptimizationProblem(dim=num_nodes, state_dim=num_nodes, objfun=obj,
-                                     solver_lib="jaxopt")
-        prb.set_obj_args(args)
-        u = prb.solve(x0=u_0)
+        prb = oc.OptimizationProblem(dim=len(interior), state_dim=len(interior),
+                                     objfun=obj, solver_lib="jaxopt")
+        prb.set_obj_args({})
+        u_interior = prb.solve(x0=jnp.asarray(u_0[interior]))
+        u = np.array(u_bnd.at[interior].set(u_interior), dtype=dt.float_dtype)
 
     assert u.dtype == dt.float_dtype
     assert u_true.dtype == u.dtype
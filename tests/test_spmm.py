@@ -14,8 +14,10 @@ def test_spmm(setup_test):
     v = np.array([[0.], [1.], [2.]], dtype=float_dtype)
     v_matrix = v*np.ones((3, 5), dtype=float_dtype)
     result_true = np.array([[2.], [3.], [10.]], dtype=float_dtype)
-    result = spmm.spmm(A, v, shape=3)
-    result_matrix = spmm.spmm(A, v_matrix, shape=3)
+    # compute the four products in one compiled graph, sharing the matrix loads
+    result, result_matrix, result_transpose, result_transpose_matrix = \
+        spmm.spmm_multi(A, (v, v_matrix, v, v_matrix),
+                        (False, False, True, True), shape=3)
     result_matrix_true = result*np.ones((3, 5), dtype=float_dtype)
 
     assert np.allclose(result, result_true)
@@ -24,8 +26,8 @@ def test_spmm(setup_test):
     result_transpose_true = np.array([[0.], [3.], [10.]], dtype=float_dtype)
     result_transpose_matrix_true = (
         result_transpose_true*np.ones((3, 5), dtype=float_dtype))
-    result = spmm.spmm(A, v, transpose=True, shape=3)
-    result_matrix = spmm.spmm(A, v_matrix, transpose=True, shape=3)
+    result = result_transpose
+    result_matrix = result_transpose_matrix
 
     assert result.dtype == float_dtype
     assert np.allclose(result, result_transpose_true)